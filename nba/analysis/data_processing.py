@@ -9,25 +9,38 @@ import pandas as pd
 
 def games_to_dataframe(games: list[dict]) -> pd.DataFrame:
     """Convert raw games payload into a display-friendly DataFrame."""
-    rows = []
+    dates: list[str] = []
+    seasons: list = []
+    statuses: list = []
+    home_teams: list = []
+    home_scores: list = []
+    visitors: list = []
+    visitor_scores: list = []
+
+    # Build one list per column in a single pass instead of a dict per row.
     for game in games:
-        home_team = game.get("home_team", {})
-        visitor_team = game.get("visitor_team", {})
-        rows.append(
-            {
-                "date": game.get("date", "")[:10],
-                "season": game.get("season"),
-                "status": game.get("status"),
-                "home_team": home_team.get("full_name"),
-                "home_score": game.get("home_team_score"),
-                "visitor_team": visitor_team.get("full_name"),
-                "visitor_score": game.get("visitor_team_score"),
-            }
-        )
-
-    frame = pd.DataFrame(rows)
+        get = game.get
+        dates.append(get("date", "")[:10])
+        seasons.append(get("season"))
+        statuses.append(get("status"))
+        home_teams.append(get("home_team", {}).get("full_name"))
+        home_scores.append(get("home_team_score"))
+        visitors.append(get("visitor_team", {}).get("full_name"))
+        visitor_scores.append(get("visitor_team_score"))
+
+    frame = pd.DataFrame(
+        {
+            "date": dates,
+            "season": seasons,
+            "status": statuses,
+            "home_team": home_teams,
+            "home_score": home_scores,
+            "visitor_team": visitors,
+            "visitor_score": visitor_scores,
+        }
+    )
     if not frame.empty:
-        frame = frame.sort_values("date", ascending=False).reset_index(drop=True)
+        frame = frame.sort_values("date", ascending=False, kind="stable").reset_index(drop=True)
     return frame
 
 
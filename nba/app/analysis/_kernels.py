@@ -0,0 +1,60 @@
+"""Compiled kernels backing the grouped metrics in ``metrics``.
+
+``numba`` is optional: without it the kernels run as plain Python loops and
+callers are expected to prefer the pandas implementation instead.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional dependency
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _rolling_mean_grouped(
+    values: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    window: int,
+    min_periods: int,
+    out: np.ndarray,
+) -> np.ndarray:
+    """Write trailing rolling means of ``values`` into ``out`` per group slice.
+
+    ``values`` and ``out`` are ``(rows, stats)`` float arrays whose rows are
+    contiguous per group; group ``g`` spans ``starts[g]:ends[g]``. NaNs are
+    skipped and count towards neither the running sum nor ``min_periods``.
+    """
+    for g in prange(starts.shape[0]):
+        start = starts[g]
+        end = ends[g]
+        for j in range(values.shape[1]):
+            total = 0.0
+            count = 0
+            for i in range(start, end):
+                value = values[i, j]
+                if not np.isnan(value):
+                    total += value
+                    count += 1
+                if i - start >= window:
+                    dropped = values[i - window, j]
+                    if not np.isnan(dropped):
+                        total -= dropped
+                        count -= 1
+                if count > 0 and count >= min_periods:
+                    out[i, j] = total / count
+                else:
+                    out[i, j] = np.nan
+    return out
+
+
+if NUMBA_AVAILABLE:
+    rolling_mean_grouped = njit(nogil=True, parallel=True, cache=True)(_rolling_mean_grouped)
+else:  # pragma: no cover - exercised only without numba
+    rolling_mean_grouped = _rolling_mean_grouped
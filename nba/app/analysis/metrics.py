@@ -7,9 +7,15 @@ any environment (scripts, notebooks, tests, or web apps).
 from __future__ import annotations
 
 from collections.abc import Sequence
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from ._kernels import NUMBA_AVAILABLE, rolling_mean_grouped
+
+_NUMBA_ENGINE_KWARGS: dict[str, bool] = {"nopython": True, "nogil": True, "parallel": True}
+
 
 def _prepare_grouped_timeseries(
     df: pd.DataFrame,
@@ -23,10 +29,30 @@ def _prepare_grouped_timeseries(
         raise ValueError(f"Missing required columns: {sorted(missing)}")
 
     prepared = df.copy()
-    prepared[date_col] = pd.to_datetime(prepared[date_col])
+    group_dtype = prepared[group_col].dtype
+    if not isinstance(group_dtype, pd.CategoricalDtype) and (
+        pd.api.types.is_object_dtype(group_dtype) or pd.api.types.is_string_dtype(group_dtype)
+    ):
+        prepared[group_col] = prepared[group_col].astype("category")
+    if not pd.api.types.is_datetime64_any_dtype(prepared[date_col]):
+        prepared[date_col] = pd.to_datetime(prepared[date_col], format="ISO8601", cache=True)
     return prepared.sort_values([group_col, date_col]).reset_index(drop=True)
 
 
+def _group_bounds(keys: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Return start/end offsets of each contiguous group in sorted ``keys``.
+
+    Null keys sort last and are left out, mirroring pandas' groupby dropna.
+    """
+    valid_rows = int(keys.notna().sum())
+    codes, _ = pd.factorize(keys.iloc[:valid_rows])
+    starts = np.flatnonzero(np.diff(codes, prepend=-1) != 0)
+    ends = np.empty_like(starts)
+    ends[:-1] = starts[1:]
+    ends[-1:] = valid_rows
+    return starts, ends
+
+
 def compute_rolling_stats(
     df: pd.DataFrame,
     stat_cols: Sequence[str],
@@ -34,6 +60,8 @@ def compute_rolling_stats(
     group_col: str = "entity",
     date_col: str = "date",
     min_periods: int = 1,
+    engine: str | None = None,
+    engine_kwargs: dict[str, Any] | None = None,
 ) -> pd.DataFrame:
     """Compute grouped rolling averages for one or more statistic columns.
 
@@ -52,6 +80,14 @@ def compute_rolling_stats(
         Chronological column.
     min_periods:
         Minimum observations required to return a value.
+    engine:
+        Optional pandas window engine (``"cython"`` or ``"numba"``). The numba
+        engine requires ``numba`` and pays off for wide ``stat_cols`` or large
+        windows on season-long logs. When omitted and ``numba`` is installed, a
+        dedicated grouped running-sum kernel is used instead of pandas.
+    engine_kwargs:
+        Engine options forwarded to pandas. Defaults to a ``nopython``,
+        ``nogil``, ``parallel`` configuration when ``engine="numba"``.
 
     Returns
     -------
@@ -62,14 +98,40 @@ def compute_rolling_stats(
     if missing:
         raise ValueError(f"Missing stat columns: {sorted(missing)}")
 
+    if not pd.api.types.is_integer(window) or window < 0:
+        raise ValueError("window must be an integer 0 or greater")
+    if min_periods < 0:
+        raise ValueError("min_periods must be >= 0")
+    if min_periods > window:
+        raise ValueError(f"min_periods {min_periods} must be <= window {window}")
+
+    if engine == "numba" and engine_kwargs is None:
+        engine_kwargs = _NUMBA_ENGINE_KWARGS
+
     prepared = _prepare_grouped_timeseries(df, group_col=group_col, date_col=date_col)
 
-    for stat in stat_cols:
-        prepared[f"{stat}_rolling_{window}"] = (
-            prepared.groupby(group_col)[stat]
-            .transform(lambda series: series.rolling(window=window, min_periods=min_periods).mean())
-            .astype(float)
-        )
+    stat_cols = list(stat_cols)
+    if not stat_cols:
+        return prepared
+
+    rolled_cols = [f"{stat}_rolling_{window}" for stat in stat_cols]
+    if engine is None and NUMBA_AVAILABLE:
+        starts, ends = _group_bounds(prepared[group_col])
+        values = prepared[stat_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        out = np.full(values.shape, np.nan)
+        rolling_mean_grouped(values, starts, ends, window, min_periods, out)
+        prepared[rolled_cols] = out
+        return prepared
+
+    rolled = (
+        prepared.groupby(group_col, sort=False, observed=True)[stat_cols]
+        .rolling(window=window, min_periods=min_periods)
+        .mean(engine=engine, engine_kwargs=engine_kwargs)
+        .reset_index(level=0, drop=True)
+        .reindex(prepared.index)
+    )
+    rolled.columns = rolled_cols
+    prepared[rolled_cols] = rolled.astype(float)
 
     return prepared
 
@@ -98,21 +160,23 @@ def compute_pace_adjusted_scoring(
     if missing:
         raise ValueError(f"Missing required columns: {sorted(missing)}")
 
-    result = df.copy()
     raw_per_100_col = f"{points_col}_per_100"
-    result[raw_per_100_col] = result[points_col] / result[possessions_col].replace(0, pd.NA) * 100
+    points = df[points_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    possessions = df[possessions_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    raw_per_100 = points / np.where(possessions == 0, np.nan, possessions) * 100
 
-    if pace_col in result.columns:
+    if pace_col in df.columns:
+        pace = df[pace_col].to_numpy(dtype=np.float64, na_value=np.nan)
         pace_anchor = (
             float(league_avg_pace)
             if league_avg_pace is not None
-            else float(result[pace_col].dropna().mean())
+            else float(np.nanmean(pace))
         )
-        result[output_col] = result[raw_per_100_col] * (pace_anchor / result[pace_col].replace(0, pd.NA))
+        pace_adjusted = raw_per_100 * (pace_anchor / np.where(pace == 0, np.nan, pace))
     else:
-        result[output_col] = result[raw_per_100_col]
+        pace_adjusted = raw_per_100
 
-    return result
+    return df.assign(**{raw_per_100_col: raw_per_100, output_col: pace_adjusted})
 
 
 def calculate_trend(
@@ -127,39 +191,60 @@ def calculate_trend(
         raise ValueError(f"Column not found: {stat_col}")
 
     prepared = _prepare_grouped_timeseries(df, group_col=group_col, date_col=date_col)
+    return _calculate_trend_prepared(
+        prepared,
+        stat_col=stat_col,
+        periods=periods,
+        group_col=group_col,
+    )
 
-    def _group_trend(group: pd.DataFrame) -> pd.Series:
-        series = group[stat_col].dropna()
-        recent = series.tail(periods)
-        prior = series.iloc[max(0, len(series) - (2 * periods)) : max(0, len(series) - periods)]
-
-        recent_mean = recent.mean() if not recent.empty else pd.NA
-        prior_mean = prior.mean() if not prior.empty else pd.NA
 
-        delta = (
-            recent_mean - prior_mean
-            if pd.notna(recent_mean) and pd.notna(prior_mean)
-            else pd.NA
-        )
-        delta_pct = (
-            (delta / prior_mean) * 100
-            if pd.notna(delta) and pd.notna(prior_mean) and prior_mean != 0
-            else pd.NA
+def _calculate_trend_prepared(
+    prepared: pd.DataFrame,
+    stat_col: str,
+    periods: int,
+    group_col: str,
+) -> pd.DataFrame:
+    """Calculate trend deltas on a frame from ``_prepare_grouped_timeseries``."""
+    # The newest ``periods`` non-null rows per group are "recent", the ones before "prior".
+    observed = prepared.loc[prepared[stat_col].notna(), [group_col, stat_col]]
+    rev_idx = observed.groupby(group_col, observed=True).cumcount(ascending=False).to_numpy()
+    in_window = rev_idx < 2 * periods
+    windowed = observed[in_window]
+    bucket = np.where(rev_idx[in_window] < periods, "recent", "prior")
+
+    entities = pd.Index(prepared[group_col].dropna().unique(), name=group_col)
+    summary = (
+        windowed.groupby([windowed[group_col], bucket], observed=True)[stat_col]
+        .agg(["mean", "size"])
+        .unstack()
+        .reindex(
+            index=entities,
+            columns=pd.MultiIndex.from_product([["mean", "size"], ["recent", "prior"]]),
         )
+    )
 
-        return pd.Series(
-            {
-                group_col: group[group_col].iloc[0],
-                "recent_mean": recent_mean,
-                "prior_mean": prior_mean,
-                "delta": delta,
-                "delta_pct": delta_pct,
-                "samples_recent": len(recent),
-                "samples_prior": len(prior),
-            }
-        )
+    recent_mean = summary[("mean", "recent")].to_numpy(dtype=float)
+    prior_mean = summary[("mean", "prior")].to_numpy(dtype=float)
+    delta = recent_mean - prior_mean
+    delta_pct = np.divide(
+        delta * 100,
+        prior_mean,
+        out=np.full_like(delta, np.nan),
+        where=prior_mean != 0,
+    )
 
-    trend = prepared.groupby(group_col, as_index=False).apply(_group_trend, include_groups=False)
+    trend = pd.DataFrame(
+        {
+            group_col: entities,
+            "recent_mean": recent_mean,
+            "prior_mean": prior_mean,
+            "delta": delta,
+            "delta_pct": delta_pct,
+            "samples_recent": summary[("size", "recent")].fillna(0).to_numpy(dtype=int),
+            "samples_prior": summary[("size", "prior")].fillna(0).to_numpy(dtype=int),
+        }
+    )
     return trend.rename(
         columns={
             "recent_mean": f"{stat_col}_recent_{periods}",
@@ -179,22 +264,25 @@ def compute_off_def_trend_deltas(
     date_col: str = "date",
 ) -> pd.DataFrame:
     """Compute offensive/defensive trend deltas and a net differential delta."""
-    offense = calculate_trend(
-        df,
+    for stat_col in (offensive_col, defensive_col):
+        if stat_col not in df.columns:
+            raise ValueError(f"Column not found: {stat_col}")
+
+    prepared = _prepare_grouped_timeseries(df, group_col=group_col, date_col=date_col)
+    offense = _calculate_trend_prepared(
+        prepared,
         stat_col=offensive_col,
         periods=periods,
         group_col=group_col,
-        date_col=date_col,
     )
-    defense = calculate_trend(
-        df,
+    defense = _calculate_trend_prepared(
+        prepared,
         stat_col=defensive_col,
         periods=periods,
         group_col=group_col,
-        date_col=date_col,
     )
 
-    merged = offense.merge(defense, on=group_col, how="outer")
+    merged = offense.merge(defense, on=group_col, how="outer", sort=False)
     off_delta_col = f"{offensive_col}_delta"
     def_delta_col = f"{defensive_col}_delta"
     merged["net_trend_delta"] = merged[off_delta_col] - merged[def_delta_col]
@@ -224,7 +312,10 @@ def rank_entities(
 
     rankings = rankings.dropna(subset=[metric])
     rankings = rankings.sort_values(metric, ascending=ascending).reset_index(drop=True)
-    rankings["rank"] = rankings[metric].rank(method="dense", ascending=ascending).astype(int)
+    values = rankings[metric].to_numpy()
+    starts_new_rank = np.ones(len(values), dtype=bool)
+    starts_new_rank[1:] = values[1:] != values[:-1]
+    rankings["rank"] = np.cumsum(starts_new_rank)
 
     ordered_cols = ["rank", entity_col, metric] + [
         col for col in rankings.columns if col not in {"rank", entity_col, metric}
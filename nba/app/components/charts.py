@@ -2,60 +2,70 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+import pyarrow as pa
 import streamlit as st
+from pyarrow import csv as pa_csv
 
 
 @st.cache_data(show_spinner=False)
 def build_team_game_log(games: list[dict]) -> pd.DataFrame:
     """Expand game records into one row per team per game with derived proxies."""
-    rows: list[dict] = []
-    for game in games:
-        game_date = pd.to_datetime(game.get("date"), errors="coerce")
-        home_team = game.get("home_team", {})
-        away_team = game.get("visitor_team", {})
-
-        home_score = game.get("home_team_score")
-        away_score = game.get("visitor_team_score")
-
-        if home_score is None or away_score is None:
-            continue
-
-        rows.append(
-            {
-                "date": game_date,
-                "team": home_team.get("full_name"),
-                "team_id": home_team.get("id"),
-                "opponent": away_team.get("full_name"),
-                "points": home_score,
-                "opponent_points": away_score,
-            }
-        )
-        rows.append(
-            {
-                "date": game_date,
-                "team": away_team.get("full_name"),
-                "team_id": away_team.get("id"),
-                "opponent": home_team.get("full_name"),
-                "points": away_score,
-                "opponent_points": home_score,
-            }
-        )
-
-    frame = pd.DataFrame(rows)
-    if frame.empty:
-        return frame
-
-    frame["point_diff"] = frame["points"] - frame["opponent_points"]
-    possessions_proxy = ((frame["points"] + frame["opponent_points"]) / 2).replace(0, pd.NA)
-    frame["net_rating_proxy"] = (frame["point_diff"] / possessions_proxy) * 100
-
-    # Balldontlie game endpoint does not expose AST/REB at game level; expose proxies.
-    frame["ast_proxy"] = frame["points"] * 0.60
-    frame["reb_proxy"] = (frame["points"] + frame["opponent_points"]) * 0.22
+    games = [
+        game
+        for game in games
+        if game.get("home_team_score") is not None and game.get("visitor_team_score") is not None
+    ]
+    if not games:
+        return pd.DataFrame()
 
-    frame["date"] = pd.to_datetime(frame["date"]).dt.date
+    count = len(games)
+    home_teams = [game.get("home_team", {}) for game in games]
+    away_teams = [game.get("visitor_team", {}) for game in games]
+    home_names = [team.get("full_name") for team in home_teams]
+    away_names = [team.get("full_name") for team in away_teams]
+    home_score = np.fromiter(
+        (game["home_team_score"] for game in games), dtype=np.int16, count=count
+    )
+    away_score = np.fromiter(
+        (game["visitor_team_score"] for game in games), dtype=np.int16, count=count
+    )
+    game_dates = pd.to_datetime(
+        pd.Series([(game.get("date") or "")[:10] for game in games]),
+        format="%Y-%m-%d",
+        errors="coerce",
+        cache=True,
+    ).dt.date
+
+    # Stack home rows on top of away rows; each side sees the other as opponent.
+    points = np.concatenate([home_score, away_score])
+    opponent_points = np.concatenate([away_score, home_score])
+    total_points = points + opponent_points
+    point_diff = points - opponent_points
+    possessions_proxy = np.where(total_points == 0, np.nan, total_points / 2)
+
+    frame = pd.DataFrame(
+        {
+            "date": np.concatenate([game_dates.to_numpy(), game_dates.to_numpy()]),
+            "team": home_names + away_names,
+            "team_id": pd.array(
+                [team.get("id") for team in home_teams] + [team.get("id") for team in away_teams],
+                dtype="Int32",
+            ),
+            "opponent": away_names + home_names,
+            "points": points,
+            "opponent_points": opponent_points,
+            "point_diff": point_diff,
+            "net_rating_proxy": (point_diff / possessions_proxy * 100).astype(np.float32),
+            # Balldontlie game endpoint does not expose AST/REB at game level; expose proxies.
+            "ast_proxy": (points * 0.60).astype(np.float32),
+            "reb_proxy": (total_points * 0.22).astype(np.float32),
+        }
+    )
+    frame["team"] = frame["team"].astype("category")
+    frame["opponent"] = frame["opponent"].astype("category")
     return frame.sort_values(["date", "team"]).reset_index(drop=True)
 
 
@@ -98,66 +108,97 @@ def ranking_frame(team_game_log: pd.DataFrame) -> pd.DataFrame:
     if team_game_log.empty:
         return pd.DataFrame()
 
-    rankings = (
-        team_game_log.groupby("team", as_index=False)
-        .agg(
-            games=("team", "count"),
-            ppg=("points", "mean"),
-            ast_proxy=("ast_proxy", "mean"),
-            reb_proxy=("reb_proxy", "mean"),
-            net_rating_proxy=("net_rating_proxy", "mean"),
-        )
-        .sort_values("ppg", ascending=False)
-        .reset_index(drop=True)
-    )
+    log = team_game_log[team_game_log["team"].notna()]
+    if log.empty:
+        return pd.DataFrame()
+    team_values = log["team"].to_numpy()
+    order = np.argsort(team_values, kind="stable")
+    log = log.iloc[order]
+    team_values = team_values[order]
+
+    starts = np.flatnonzero(np.r_[True, team_values[1:] != team_values[:-1]])
+    teams = team_values[starts]
+    metrics = {
+        "ppg": "points",
+        "ast_proxy": "ast_proxy",
+        "reb_proxy": "reb_proxy",
+        "net_rating_proxy": "net_rating_proxy",
+    }
+    columns: dict[str, np.ndarray] = {
+        "team": teams,
+        "games": np.diff(np.append(starts, len(log))).astype(np.int32),
+    }
+    for name, source in metrics.items():
+        values = log[source].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+        counts = np.add.reduceat(valid, starts)
+        means = np.divide(sums, counts, out=np.full_like(sums, np.nan), where=counts > 0)
+        columns[name] = means.astype(np.float32)
+
+    rankings = pd.DataFrame(columns).sort_values("ppg", ascending=False).reset_index(drop=True)
     rankings["rank"] = rankings.index + 1
     return rankings[["rank", "team", "games", "ppg", "ast_proxy", "reb_proxy", "net_rating_proxy"]]
 
 
+METRIC_LABELS = {
+    "ppg": "Points Per Game",
+    "ast_proxy": "Assist Proxy",
+    "reb_proxy": "Rebound Proxy",
+    "net_rating_proxy": "Net Rating Proxy",
+}
+
+
 def make_trend_chart(trend_data: pd.DataFrame, metric: str):
     """Build line chart for selected trend metric."""
-    labels = {
-        "ppg": "Points Per Game",
-        "ast_proxy": "Assist Proxy",
-        "reb_proxy": "Rebound Proxy",
-        "net_rating_proxy": "Net Rating Proxy",
-    }
-    fig = px.line(
-        trend_data,
-        x="date",
-        y=metric,
-        markers=True,
-        title=f"{labels[metric]} Trend by Date",
-        labels={"date": "Date", metric: labels[metric]},
-        hover_data={"date": True, metric: ':.2f'},
+    label = METRIC_LABELS[metric]
+    fig = go.Figure(
+        go.Scattergl(
+            x=trend_data["date"],
+            y=trend_data[metric],
+            mode="lines+markers",
+            name=label,
+            hovertemplate=f"Date=%{{x}}<br>{label}=%{{y:.2f}}<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        title=f"{label} Trend by Date",
+        xaxis_title="Date",
+        yaxis_title=label,
+        hovermode="x unified",
     )
-    fig.update_layout(hovermode="x unified")
     return fig
 
 
 def make_rankings_chart(rankings: pd.DataFrame, metric: str):
     """Build bar chart for team rankings by metric."""
-    labels = {
-        "ppg": "Points Per Game",
-        "ast_proxy": "Assist Proxy",
-        "reb_proxy": "Rebound Proxy",
-        "net_rating_proxy": "Net Rating Proxy",
-    }
+    label = METRIC_LABELS[metric]
     metric_sorted = rankings.sort_values(metric, ascending=False)
-    fig = px.bar(
-        metric_sorted,
-        x="team",
-        y=metric,
-        color=metric,
-        title=f"Team Rankings by {labels[metric]}",
-        labels={"team": "Team", metric: labels[metric]},
-        hover_data={"team": True, metric: ':.2f', "games": True},
+    fig = go.Figure(
+        go.Bar(
+            x=metric_sorted["team"],
+            y=metric_sorted[metric],
+            marker={"color": metric_sorted[metric], "coloraxis": "coloraxis"},
+            customdata=metric_sorted["games"],
+            hovertemplate=(
+                f"Team=%{{x}}<br>{label}=%{{y:.2f}}<br>games=%{{customdata}}<extra></extra>"
+            ),
+        )
+    )
+    fig.update_layout(
+        title=f"Team Rankings by {label}",
+        xaxis_title="Team",
+        yaxis_title=label,
+        xaxis_tickangle=-35,
+        coloraxis_showscale=False,
     )
-    fig.update_layout(xaxis_tickangle=-35, coloraxis_showscale=False)
     return fig
 
 
 @st.cache_data(show_spinner=False)
 def dataframe_to_csv(df: pd.DataFrame) -> bytes:
     """Serialize frame to CSV bytes for download button."""
-    return df.to_csv(index=False).encode("utf-8")
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    pa_csv.write_csv(table, sink)
+    return sink.getvalue().to_pybytes()
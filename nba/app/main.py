@@ -22,6 +22,8 @@ from nba.services.nba_client import NBAClient
 
 st.set_page_config(page_title="NBA Data Analysis", page_icon="🏀", layout="wide")
 
+MIN_PLAYER_SEARCH_LENGTH = 3
+
 
 @st.cache_resource
 def get_client() -> NBAClient:
@@ -75,8 +77,9 @@ with st.sidebar:
         placeholder="Select one or more teams",
     )
 
-    player_search = st.text_input("Player search", placeholder="e.g. LeBron")
-    if player_search:
+    player_search = st.text_input("Player search", placeholder="e.g. LeBron").strip()
+    # Short prefixes match too broadly to be useful; wait for a few characters.
+    if len(player_search) >= MIN_PLAYER_SEARCH_LENGTH:
         try:
             players = fetch_players(player_search)
         except Exception as exc:
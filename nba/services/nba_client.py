@@ -2,12 +2,35 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, replace
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Any
 
+import httpx
 import pandas as pd
+import requests
 from nba_api.stats.endpoints import leaguedashteamstats, playergamelog
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - only probed so httpx can negotiate HTTP/2
+except ImportError:  # pragma: no cover - installed via ``httpx[http2]``
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
 
 
 class NBAClientError(RuntimeError):
@@ -37,7 +60,7 @@ def _request_config(season: str, **overrides: Any) -> NBARequestConfig:
 def _normalize_endpoint(endpoint: Any) -> pd.DataFrame:
     """Normalize endpoint output into a pandas DataFrame."""
     try:
-        return endpoint.get_data_frames()[0].copy()
+        return endpoint.get_data_frames()[0]
     except Exception as exc:  # pragma: no cover - protective parsing guard
         raise NBAClientError("Unable to normalize NBA API endpoint response.") from exc
 
@@ -124,8 +147,171 @@ def get_league_advanced_stats(
         measure_type_detailed_defense="Advanced",
     )
 
-import requests
-from datetime import date
+
+_MAX_PAGE_WORKERS = 8
+
+
+def _build_session(session: requests.Session | None = None) -> requests.Session:
+    """Configure a pooled, retrying HTTP session for the balldontlie API."""
+    session = session if session is not None else requests.Session()
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=_MAX_PAGE_WORKERS,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+            # Hand the final error response back so ``raise_for_status`` still raises HTTPError.
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def build_cached_session(
+    cache_name: str = "nba_cache",
+    backend: str = "sqlite",
+    expire_after: timedelta = timedelta(hours=12),
+) -> requests.Session:
+    """Create a session whose GET responses persist across processes.
+
+    Requires the optional ``requests-cache`` package. Pass the result to
+    ``NBAClient(session=...)``; team lists never expire, player searches last
+    an hour and game listings ten minutes, other URLs use ``expire_after``.
+    """
+    try:
+        import requests_cache
+    except ImportError as exc:
+        raise NBAClientError(
+            "On-disk response caching requires the 'requests-cache' package."
+        ) from exc
+
+    session = requests_cache.CachedSession(
+        cache_name=cache_name,
+        backend=backend,
+        expire_after=expire_after,
+        urls_expire_after={
+            "*/teams": requests_cache.NEVER_EXPIRE,
+            "*/players": timedelta(hours=1),
+            "*/games": timedelta(minutes=10),
+        },
+        allowable_methods=("GET",),
+        stale_if_error=True,
+    )
+    return _build_session(session)
+
+
+class _TTLCache:
+    """Small thread-safe LRU mapping whose entries optionally expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _AsyncRateLimiter:
+    """Token bucket allowing ``max_rate`` acquisitions per ``time_period`` seconds."""
+
+    def __init__(self, max_rate: float, time_period: float = 1.0) -> None:
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive.")
+        self.max_rate = max_rate
+        self.time_period = time_period
+        # Hold at least one whole token so sub-1 rates can still admit requests.
+        self.capacity = max(1.0, max_rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def __aenter__(self) -> _AsyncRateLimiter:
+        while True:
+            now = time.monotonic()
+            refill = (now - self._updated) * self.max_rate / self.time_period
+            self._tokens = min(self.capacity, self._tokens + refill)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return self
+            await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+def _teams_cache() -> _TTLCache:
+    return _TTLCache(maxsize=1)
+
+
+def _players_cache() -> _TTLCache:
+    return _TTLCache(maxsize=256, ttl=3600)
+
+
+def _decode_json(response: requests.Response | httpx.Response) -> dict[str, Any]:
+    """Decode a JSON response body, preferring ``orjson`` when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _players_params(search: str) -> dict[str, Any]:
+    params: dict[str, Any] = {"per_page": 50}
+    if search:
+        params["search"] = search
+    return params
+
+
+@lru_cache(maxsize=1024)
+def _isoformat(day: date) -> str:
+    return day.isoformat()
+
+
+def _games_params(
+    start_date: date,
+    end_date: date,
+    team_ids: list[int] | None,
+    per_page: int,
+) -> list[tuple[str, Any]]:
+    params: list[tuple[str, Any]] = [
+        ("start_date", _isoformat(start_date)),
+        ("end_date", _isoformat(end_date)),
+        ("per_page", per_page),
+    ]
+    if team_ids:
+        params.extend(("team_ids[]", team_id) for team_id in team_ids)
+    return params
+
+
+def _total_pages(payload: dict[str, Any]) -> int:
+    return int(payload.get("meta", {}).get("total_pages") or 1)
 
 
 @dataclass
@@ -134,26 +320,90 @@ class NBAClient:
 
     base_url: str = "https://www.balldontlie.io/api/v1"
     timeout_seconds: int = 10
+    session: requests.Session = field(default_factory=_build_session, repr=False, compare=False)
+    _teams: _TTLCache = field(
+        default_factory=_teams_cache, init=False, repr=False, compare=False
+    )
+    _players: _TTLCache = field(
+        default_factory=_players_cache, init=False, repr=False, compare=False
+    )
+    _inflight: dict[str, Future] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _inflight_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _url_prefix: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._url_prefix = self.base_url.rstrip("/") + "/"
+
+    def close(self) -> None:
+        """Release pooled connections held by the session."""
+        self.session.close()
+
+    def clear_cache(self) -> None:
+        """Drop cached team and player lookups."""
+        self._teams.clear()
+        self._players.clear()
+
+    def __enter__(self) -> NBAClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
-    def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        response = requests.get(
-            f"{self.base_url}/{path}",
+    def _get(
+        self,
+        path: str,
+        params: dict[str, Any] | list[tuple[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        response = self.session.get(
+            self._url_prefix + path,
             params=params,
             timeout=self.timeout_seconds,
         )
         response.raise_for_status()
-        return response.json()
+        return _decode_json(response)
 
     def get_teams(self) -> list[dict[str, Any]]:
-        payload = self._get("teams")
-        return payload.get("data", [])
+        teams = self._teams.get("teams")
+        if teams is None:
+            teams = self._get("teams").get("data", [])
+            self._teams.set("teams", teams)
+        return list(teams)
 
     def get_players(self, search: str = "") -> list[dict[str, Any]]:
-        params = {"per_page": 50}
-        if search:
-            params["search"] = search
-        payload = self._get("players", params=params)
-        return payload.get("data", [])
+        key = search.lower()
+        players = self._players.get(key)
+        if players is not None:
+            return list(players)
+
+        with self._inflight_lock:
+            players = self._players.get(key)
+            if players is not None:
+                return list(players)
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = self._inflight[key] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return list(pending.result())
+
+        try:
+            players = self._get("players", params=_players_params(search)).get("data", [])
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        else:
+            self._players.set(key, players)
+            pending.set_result(players)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        return list(players)
 
     def get_games(
         self,
@@ -162,13 +412,195 @@ class NBAClient:
         team_ids: list[int] | None = None,
         per_page: int = 100,
     ) -> list[dict[str, Any]]:
-        params: dict[str, Any] = {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "per_page": per_page,
-        }
-        if team_ids:
-            for idx, team_id in enumerate(team_ids):
-                params[f"team_ids[{idx}]"] = team_id
+        return self.get_games_all_pages(start_date, end_date, team_ids=team_ids, per_page=per_page)
+
+    def get_games_all_pages(
+        self,
+        start_date: date,
+        end_date: date,
+        team_ids: list[int] | None = None,
+        per_page: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Fetch every page of games in the range, requesting pages 2..N concurrently."""
+        params = _games_params(start_date, end_date, team_ids, per_page)
         payload = self._get("games", params=params)
-        return payload.get("data", [])
+        games = list(payload.get("data", []))
+
+        total_pages = _total_pages(payload)
+        if total_pages > 1:
+            remaining = range(2, total_pages + 1)
+            with ThreadPoolExecutor(max_workers=min(_MAX_PAGE_WORKERS, len(remaining))) as pool:
+                pages = pool.map(
+                    lambda page: self._get("games", params=[*params, ("page", page)]),
+                    remaining,
+                )
+                for page_payload in pages:
+                    games.extend(page_payload.get("data", []))
+        return games
+
+
+@dataclass
+class AsyncNBAClient:
+    """Async counterpart of ``NBAClient`` for fanning out concurrent requests.
+
+    All calls share one ``httpx.AsyncClient`` keep-alive pool, so independent
+    lookups can be awaited together with ``asyncio.gather``. With ``http2``
+    enabled (and ``h2`` installed) concurrent requests are multiplexed over a
+    single TLS connection.
+    """
+
+    base_url: str = "https://www.balldontlie.io/api/v1"
+    timeout_seconds: int = 10
+    http2: bool = True
+    max_requests_per_second: float | None = 5.0
+    client: httpx.AsyncClient | None = field(default=None, repr=False, compare=False)
+    _teams: _TTLCache = field(
+        default_factory=_teams_cache, init=False, repr=False, compare=False
+    )
+    _players: _TTLCache = field(
+        default_factory=_players_cache, init=False, repr=False, compare=False
+    )
+    _inflight: dict[str, asyncio.Task] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _limiter: _AsyncRateLimiter | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.max_requests_per_second is not None:
+            if self.max_requests_per_second <= 0:
+                raise ValueError("max_requests_per_second must be positive or None.")
+            self._limiter = _AsyncRateLimiter(self.max_requests_per_second)
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                http2=self.http2 and _HTTP2_AVAILABLE,
+            )
+
+    async def aclose(self) -> None:
+        """Release pooled connections held by the HTTP client."""
+        await self.client.aclose()
+
+    def clear_cache(self) -> None:
+        """Drop cached team and player lookups."""
+        self._teams.clear()
+        self._players.clear()
+
+    async def __aenter__(self) -> AsyncNBAClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _get(
+        self,
+        path: str,
+        params: dict[str, Any] | list[tuple[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        if self._limiter is None:
+            response = await self.client.get(path, params=params)
+        else:
+            async with self._limiter:
+                response = await self.client.get(path, params=params)
+        response.raise_for_status()
+        return _decode_json(response)
+
+    async def get_teams(self) -> list[dict[str, Any]]:
+        teams = self._teams.get("teams")
+        if teams is None:
+            teams = (await self._get("teams")).get("data", [])
+            self._teams.set("teams", teams)
+        return list(teams)
+
+    async def get_players(self, search: str = "") -> list[dict[str, Any]]:
+        key = search.lower()
+        players = self._players.get(key)
+        if players is not None:
+            return list(players)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_players(search, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared task so one cancelled caller does not cancel the others.
+        return list(await asyncio.shield(task))
+
+    async def _fetch_players(self, search: str, key: str) -> list[dict[str, Any]]:
+        players = (await self._get("players", params=_players_params(search))).get("data", [])
+        self._players.set(key, players)
+        return players
+
+    async def get_games(
+        self,
+        start_date: date,
+        end_date: date,
+        team_ids: list[int] | None = None,
+        per_page: int = 100,
+    ) -> list[dict[str, Any]]:
+        return await self.get_games_all_pages(
+            start_date, end_date, team_ids=team_ids, per_page=per_page
+        )
+
+    async def get_games_all_pages(
+        self,
+        start_date: date,
+        end_date: date,
+        team_ids: list[int] | None = None,
+        per_page: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Fetch every page of games in the range, gathering pages 2..N concurrently."""
+        params = _games_params(start_date, end_date, team_ids, per_page)
+        payload = await self._get("games", params=params)
+        games = list(payload.get("data", []))
+
+        total_pages = _total_pages(payload)
+        if total_pages > 1:
+            pages = await asyncio.gather(
+                *(
+                    self._get("games", params=[*params, ("page", page)])
+                    for page in range(2, total_pages + 1)
+                )
+            )
+            for page_payload in pages:
+                games.extend(page_payload.get("data", []))
+        return games
+
+    async def get_games_many(
+        self,
+        ranges: list[tuple[date, date]],
+        team_ids: list[int] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch games for several date ranges concurrently, in ``ranges`` order."""
+        return await asyncio.gather(
+            *(self.get_games(start, end, team_ids=team_ids) for start, end in ranges)
+        )
+
+    async def warmup(self) -> None:
+        """Open the pooled connection ahead of time by loading (and caching) teams."""
+        teams = (await self._get("teams")).get("data", [])
+        self._teams.set("teams", teams)
+
+    async def gather_all(
+        self,
+        teams: bool = True,
+        players: str | None = None,
+        games: tuple[date, date] | None = None,
+        team_ids: list[int] | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch teams, a player search and a games range concurrently.
+
+        Only the requested lookups are issued; results are keyed by
+        ``"teams"``, ``"players"`` and ``"games"``.
+        """
+        requests_by_key: dict[str, Any] = {}
+        if teams:
+            requests_by_key["teams"] = self.get_teams()
+        if players is not None:
+            requests_by_key["players"] = self.get_players(players)
+        if games is not None:
+            requests_by_key["games"] = self.get_games(games[0], games[1], team_ids=team_ids)
+
+        results = await asyncio.gather(*requests_by_key.values())
+        return dict(zip(requests_by_key, results))
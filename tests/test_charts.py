@@ -0,0 +1,102 @@
+import pandas as pd
+import pytest
+
+from nba.app.components.charts import build_team_game_log, ranking_frame
+
+
+def _row_wise_team_game_log(games: list[dict]) -> pd.DataFrame:
+    """Per-row reference for ``build_team_game_log``."""
+    rows = []
+    for game in games:
+        home, away = game["home_team"], game["visitor_team"]
+        home_score, away_score = game["home_team_score"], game["visitor_team_score"]
+        if home_score is None or away_score is None:
+            continue
+        game_date = pd.to_datetime(game["date"]).date()
+        for team, opponent, points, opponent_points in (
+            (home, away, home_score, away_score),
+            (away, home, away_score, home_score),
+        ):
+            total = points + opponent_points
+            rows.append(
+                {
+                    "date": game_date,
+                    "team": team["full_name"],
+                    "team_id": team["id"],
+                    "opponent": opponent["full_name"],
+                    "points": points,
+                    "opponent_points": opponent_points,
+                    "point_diff": points - opponent_points,
+                    "net_rating_proxy": (
+                        (points - opponent_points) / (total / 2) * 100 if total else float("nan")
+                    ),
+                    "ast_proxy": points * 0.60,
+                    "reb_proxy": total * 0.22,
+                }
+            )
+    return pd.DataFrame(rows).sort_values(["date", "team"]).reset_index(drop=True)
+
+
+def test_build_team_game_log_matches_row_wise_expansion():
+    teams = {name: {"id": team_id, "full_name": name} for team_id, name in enumerate("ABCD", 1)}
+
+    def game(day: str, home: str, away: str, home_score, away_score) -> dict:
+        return {
+            "date": f"2024-01-{day}T00:00:00.000Z",
+            "home_team": teams[home],
+            "visitor_team": teams[away],
+            "home_team_score": home_score,
+            "visitor_team_score": away_score,
+        }
+
+    games = [
+        game("03", "C", "A", 101, 99),
+        game("01", "A", "B", 110, 104),
+        game("02", "D", "C", None, None),
+        game("01", "D", "C", 0, 0),
+        game("02", "B", "D", 95, 120),
+    ]
+
+    result = build_team_game_log(games)
+    expected = _row_wise_team_game_log(games)
+
+    pd.testing.assert_frame_equal(
+        result.astype({"team": object, "opponent": object, "team_id": "int64"}),
+        expected,
+        check_dtype=False,
+        rtol=1e-6,
+    )
+
+
+def test_ranking_frame_ignores_non_alphabetical_category_order():
+    log = pd.DataFrame(
+        {
+            "team": pd.Categorical(["Z", "Z", "A", "A", "A"], categories=["Z", "A"]),
+            "points": [100, 102, 90, 95, 100],
+            "ast_proxy": [60.0, 61.2, 54.0, 57.0, 60.0],
+            "reb_proxy": [44.0, 44.0, 40.0, 41.0, 42.0],
+            "net_rating_proxy": [1.0, 3.0, -1.0, -2.0, -3.0],
+        }
+    )
+
+    rankings = ranking_frame(log).set_index("team")
+
+    assert rankings.loc["Z", "games"] == 2
+    assert rankings.loc["A", "games"] == 3
+    assert rankings.loc["Z", "ppg"] == pytest.approx(101.0)
+    assert rankings.loc["A", "ppg"] == pytest.approx(95.0)
+    assert rankings.loc["A", "net_rating_proxy"] == pytest.approx(-2.0)
+
+
+def test_ranking_frame_returns_empty_frame_when_no_team_is_known():
+    log = pd.DataFrame(
+        {
+            "team": pd.Categorical([None, None], categories=["A"]),
+            "points": [100, 102],
+            "ast_proxy": [60.0, 61.2],
+            "reb_proxy": [44.0, 44.0],
+            "net_rating_proxy": [1.0, 3.0],
+        }
+    )
+
+    assert ranking_frame(log).empty
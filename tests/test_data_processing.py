@@ -0,0 +1,34 @@
+from nba.analysis.data_processing import games_to_dataframe
+
+
+def _game(date: str, home: str) -> dict:
+    return {
+        "date": date,
+        "season": 2023,
+        "status": "Final",
+        "home_team": {"full_name": home},
+        "home_team_score": 100,
+        "visitor_team": {"full_name": "Visitors"},
+        "visitor_team_score": 90,
+    }
+
+
+def test_games_to_dataframe_keeps_api_order_for_same_day_games():
+    games = [
+        _game("2024-01-02", "Z"),
+        _game("2024-01-01T00:00:00.000Z", "Early"),
+        _game("2024-01-02", "A"),
+        _game("2024-01-03", "Late"),
+        _game("2024-01-02", "B"),
+    ]
+
+    frame = games_to_dataframe(games)
+
+    assert frame["date"].tolist() == [
+        "2024-01-03",
+        "2024-01-02",
+        "2024-01-02",
+        "2024-01-02",
+        "2024-01-01",
+    ]
+    assert frame["home_team"].tolist() == ["Late", "Z", "A", "B", "Early"]
@@ -0,0 +1,78 @@
+import math
+
+import pandas as pd
+import pytest
+
+from nba.app.analysis.metrics import calculate_trend, compute_rolling_stats
+
+
+@pytest.fixture
+def game_log():
+    return pd.DataFrame(
+        {
+            "entity": ["A", "A", "A", "A"],
+            "date": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"],
+            "points": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+
+
+@pytest.mark.parametrize("engine", [None, "cython"])
+@pytest.mark.parametrize(
+    ("window", "min_periods", "message"),
+    [
+        (-1, 1, "window must be an integer 0 or greater"),
+        (2, 3, "min_periods 3 must be <= window 2"),
+        (2, -1, "min_periods must be >= 0"),
+    ],
+)
+def test_compute_rolling_stats_rejects_invalid_windows(
+    game_log, engine, window, min_periods, message
+):
+    with pytest.raises(ValueError, match=message):
+        compute_rolling_stats(
+            game_log, ["points"], window=window, min_periods=min_periods, engine=engine
+        )
+
+
+def test_compute_rolling_stats_trailing_mean(game_log):
+    result = compute_rolling_stats(game_log, ["points"], window=2)
+
+    assert result["points_rolling_2"].tolist() == [1.0, 1.5, 2.5, 3.5]
+
+
+def test_calculate_trend_windows_skip_missing_values():
+    log = pd.DataFrame(
+        {
+            "entity": ["A"] * 6 + ["B", "B", "C"],
+            "date": [
+                "2024-01-06",
+                "2024-01-01",
+                "2024-01-02",
+                "2024-01-03",
+                "2024-01-04",
+                "2024-01-05",
+                "2024-01-01",
+                "2024-01-02",
+                "2024-01-01",
+            ],
+            "points": [6.0, 1.0, 2.0, None, 4.0, 5.0, None, None, 7.0],
+        }
+    )
+
+    trend = calculate_trend(log, "points", periods=2).set_index("entity")
+
+    assert trend.loc["A", "points_recent_2"] == pytest.approx(5.5)
+    assert trend.loc["A", "points_prior_2"] == pytest.approx(3.0)
+    assert trend.loc["A", "points_delta"] == pytest.approx(2.5)
+    assert trend.loc["A", "points_delta_pct"] == pytest.approx(250 / 3)
+    assert trend.loc["A", ["samples_recent", "samples_prior"]].tolist() == [2, 2]
+
+    assert math.isnan(trend.loc["B", "points_recent_2"])
+    assert math.isnan(trend.loc["B", "points_prior_2"])
+    assert math.isnan(trend.loc["B", "points_delta"])
+    assert trend.loc["B", ["samples_recent", "samples_prior"]].tolist() == [0, 0]
+
+    assert trend.loc["C", "points_recent_2"] == pytest.approx(7.0)
+    assert math.isnan(trend.loc["C", "points_prior_2"])
+    assert trend.loc["C", ["samples_recent", "samples_prior"]].tolist() == [1, 0]
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from nba.services.nba_client import AsyncNBAClient, NBAClient, _AsyncRateLimiter, _TTLCache
+
+
+def test_rate_limiter_admits_requests_below_one_per_second():
+    limiter = _AsyncRateLimiter(max_rate=0.5)
+
+    async def acquire_twice() -> float:
+        started = time.monotonic()
+        async with limiter:
+            pass
+        async with limiter:
+            pass
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(asyncio.wait_for(acquire_twice(), timeout=5))
+    assert 1.5 <= elapsed < 3
+
+
+@pytest.mark.parametrize("rate", [0, -1.0])
+def test_async_client_rejects_non_positive_rate(rate):
+    with pytest.raises(ValueError):
+        AsyncNBAClient(max_requests_per_second=rate)
+
+
+def test_ttl_cache_survives_concurrent_eviction():
+    cache = _TTLCache(maxsize=4)
+
+    def churn(offset: int) -> None:
+        for i in range(2000):
+            cache.set((offset + i) % 16, i)
+            cache.get((offset + i + 1) % 16)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(churn, range(8)))
+
+    assert len(cache._entries) <= 4
+
+
+def test_get_games_collects_every_page_in_order(monkeypatch):
+    client = NBAClient()
+    requested_pages = []
+
+    def fake_get(path, params=None):
+        page = dict(params).get("page", 1)
+        requested_pages.append(page)
+        time.sleep(0.01 * (4 - page))
+        return {"data": [{"id": page * 10 + i} for i in range(2)], "meta": {"total_pages": 3}}
+
+    monkeypatch.setattr(client, "_get", fake_get)
+
+    games = client.get_games(date(2024, 1, 1), date(2024, 1, 31), team_ids=[1, 2])
+
+    assert [game["id"] for game in games] == [10, 11, 20, 21, 30, 31]
+    assert sorted(requested_pages) == [1, 2, 3]
+    client.close()